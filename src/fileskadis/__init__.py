@@ -1,7 +1,12 @@
 """fileskadis - A file operations library for PDF/Image processing."""
 
+import platform
+
 from fileskadis.core import Aggregator, Masker, Separator
+from fileskadis.core.utils import PILLOW_SIMD, get_logger
 
 __version__ = "0.1.0"
 __all__ = ["Aggregator", "Separator", "Masker"]
 
+get_logger(__name__).debug("pillow_backend", simd=PILLOW_SIMD, machine=platform.machine())
+
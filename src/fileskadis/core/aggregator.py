@@ -7,7 +7,7 @@ from typing import Union
 import pypdfium2 as pdfium
 from PIL import Image
 
-from fileskadis.core.utils import get_logger, is_image, is_pdf, validate_file
+from fileskadis.core.utils import get_logger, is_image, is_pdf, render_image, validate_file
 
 log = get_logger(__name__)
 
@@ -103,8 +103,7 @@ class Aggregator:
             elif is_pdf(path):
                 pdf = pdfium.PdfDocument(path)
                 for page in pdf:
-                    bitmap = page.render(scale=scale)
-                    previews.append(bitmap.to_pil())
+                    previews.append(render_image(page, scale))
                 pdf.close()
 
         return previews
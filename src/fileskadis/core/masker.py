@@ -1,14 +1,26 @@
 """PDF masking/redaction module."""
 
+import io
+import math
+import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal, Union
 
+import numpy as np
 import pypdfium2 as pdfium
-from PIL import Image, ImageDraw, ImageFilter
+from PIL import Image, ImageColor, ImageFilter
 
-from fileskadis.core.utils import get_logger, validate_pdf
+from fileskadis.core.utils import (
+    PDFIUM_LOCK,
+    get_logger,
+    open_pdf_cached,
+    render_array,
+    render_image,
+    validate_pdf,
+)
 
 log = get_logger(__name__)
 
@@ -30,6 +42,31 @@ class Region:
 
 MaskType = Literal["blur", "black", "white"]
 
+# Resolution (DPI) at which rendered pages are placed in the output PDF.
+OUTPUT_RESOLUTION = 150
+OUTPUT_JPEG_QUALITY = 85
+
+# Radii from which three box blur passes replace GaussianBlur.
+BOX_BLUR_MIN_RADIUS = 10
+BOX_BLUR_PASSES = 3
+
+
+def _region_boxes(regions: list[Region], width: int, height: int) -> np.ndarray:
+    """Stack regions into an (N, 4) array of (left, top, right, bottom) boxes.
+
+    Boxes are clipped to the image bounds and empty boxes are dropped.
+    """
+    boxes = np.array([r.box for r in regions], dtype=np.int32).reshape(-1, 4)
+    np.clip(boxes[:, 0::2], 0, width, out=boxes[:, 0::2])
+    np.clip(boxes[:, 1::2], 0, height, out=boxes[:, 1::2])
+    keep = (boxes[:, 2] > boxes[:, 0]) & (boxes[:, 3] > boxes[:, 1])
+    return boxes[keep]
+
+
+def _box_blur_radius(sigma: float, passes: int = BOX_BLUR_PASSES) -> float:
+    """Box radius whose repeated passes match the variance of a Gaussian of `sigma`."""
+    return (math.sqrt(12 * sigma * sigma / passes + 1) - 1) / 2
+
 
 class Masker:
     """Apply irreversible redactions to PDF pages."""
@@ -73,19 +110,16 @@ class Masker:
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
-            page_images = []
-
-            for page_idx in range(page_count):
-                page_num = page_idx + 1
-                bitmap = pdf[page_idx].render(scale=self.render_scale)
-                img = bitmap.to_pil()
 
-                if page_num in page_regions:
-                    regions = page_regions[page_num]
-                    img = self._apply_masks(img, regions, mask_type)
-                    log.debug("page_masked", page=page_num, regions=len(regions))
-
-                page_images.append(img)
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                page_images = list(
+                    executor.map(
+                        lambda page_idx: self._process_page(
+                            pdf, page_idx, page_regions.get(page_idx + 1), mask_type
+                        ),
+                        range(page_count),
+                    )
+                )
 
             pdf.close()
             self._images_to_pdf(page_images, output_path)
@@ -93,6 +127,24 @@ class Masker:
         log.info("redaction_complete", output=str(output_path))
         return output_path
 
+    def _process_page(
+        self,
+        pdf: pdfium.PdfDocument,
+        page_idx: int,
+        regions: list[Region] | None,
+        mask_type: MaskType,
+    ) -> Image.Image:
+        """Render a single page and mask it. Safe to call from worker threads."""
+        with PDFIUM_LOCK:
+            arr = render_array(pdf[page_idx], self.render_scale)
+        img = Image.fromarray(arr)
+
+        if regions:
+            img = self._apply_masks(img, regions, mask_type)
+            log.debug("page_masked", page=page_idx + 1, regions=len(regions))
+
+        return img
+
     def redact_page(
         self,
         pdf_path: Union[str, Path],
@@ -123,49 +175,68 @@ class Masker:
         mask_type: MaskType,
     ) -> Image.Image:
         """Apply mask to image regions."""
-        result = img.copy()
-
-        for region in regions:
-            box = region.box
-            box = (
-                max(0, box[0]),
-                max(0, box[1]),
-                min(img.width, box[2]),
-                min(img.height, box[3]),
-            )
-
-            if box[2] <= box[0] or box[3] <= box[1]:
-                continue
-
-            if mask_type == "blur":
-                cropped = result.crop(box)
-                blurred = cropped.filter(ImageFilter.GaussianBlur(radius=self.blur_radius))
-                result.paste(blurred, box)
-            else:
-                draw = ImageDraw.Draw(result)
-                color = "black" if mask_type == "black" else "white"
-                draw.rectangle(box, fill=color)
-
-        return result
+        if img.mode not in ("L", "RGB", "RGBA"):
+            img = img.convert("RGB")
+
+        boxes = _region_boxes(regions, img.width, img.height)
+        if not len(boxes):
+            return img.copy()
+
+        arr = np.array(img)
+
+        if mask_type == "blur":
+            # Blur the bounding box of all regions once, then copy only the masked pixels.
+            x0, y0 = (int(v) for v in boxes[:, :2].min(axis=0))
+            x1, y1 = (int(v) for v in boxes[:, 2:].max(axis=0))
+            blurred = np.asarray(self._blur(img.crop((x0, y0, x1, y1))))
+            for left, top, right, bottom in boxes:
+                arr[top:bottom, left:right] = blurred[
+                    top - y0 : bottom - y0, left - x0 : right - x0
+                ]
+        else:
+            fill = ImageColor.getcolor(mask_type, img.mode)
+            for left, top, right, bottom in boxes:
+                arr[top:bottom, left:right] = fill
+
+        return Image.fromarray(arr)
+
+    def _blur(self, img: Image.Image) -> Image.Image:
+        """Blur an image, using repeated box blurs for large radii."""
+        if self.blur_radius < BOX_BLUR_MIN_RADIUS:
+            return img.filter(ImageFilter.GaussianBlur(radius=self.blur_radius))
+
+        box_blur = ImageFilter.BoxBlur(radius=_box_blur_radius(self.blur_radius))
+        for _ in range(BOX_BLUR_PASSES):
+            img = img.filter(box_blur)
+        return img
 
     def _images_to_pdf(self, images: list[Image.Image], output: Path) -> None:
-        """Convert list of images to PDF."""
+        """Convert list of images to PDF, one JPEG page each."""
         if not images:
             raise ValueError("No images to convert")
 
-        rgb_images = []
+        pdf = pdfium.PdfDocument.new()
+
         for img in images:
             if img.mode != "RGB":
                 img = img.convert("RGB")
-            rgb_images.append(img)
-
-        rgb_images[0].save(
-            output,
-            "PDF",
-            save_all=True,
-            append_images=rgb_images[1:] if len(rgb_images) > 1 else [],
-            resolution=150,
-        )
+
+            buffer = io.BytesIO()
+            img.save(buffer, "JPEG", quality=OUTPUT_JPEG_QUALITY)
+            buffer.seek(0)
+
+            width = img.width * 72 / OUTPUT_RESOLUTION
+            height = img.height * 72 / OUTPUT_RESOLUTION
+            page = pdf.new_page(width, height)
+            image = pdfium.PdfImage.new(pdf)
+            image.load_jpeg(buffer, inline=True)
+            image.set_matrix(pdfium.PdfMatrix().scale(width, height))
+            page.insert_obj(image)
+            page.gen_content()
+            page.close()
+
+        pdf.save(output)
+        pdf.close()
 
     def preview_page(
         self,
@@ -189,15 +260,12 @@ class Masker:
             PIL Image preview
         """
         pdf_path = validate_pdf(pdf_path)
-        pdf = pdfium.PdfDocument(pdf_path)
+        pdf = open_pdf_cached(pdf_path)
 
         if page_num < 1 or page_num > len(pdf):
-            pdf.close()
             raise ValueError(f"Page {page_num} out of range")
 
-        bitmap = pdf[page_num - 1].render(scale=self.render_scale * scale)
-        img = bitmap.to_pil()
-        pdf.close()
+        img = render_image(pdf[page_num - 1], self.render_scale * scale)
 
         if regions:
             scaled_regions = [
@@ -221,15 +289,13 @@ class Masker:
             (width, height) tuple in pixels
         """
         pdf_path = validate_pdf(pdf_path)
-        pdf = pdfium.PdfDocument(pdf_path)
+        pdf = open_pdf_cached(pdf_path)
 
         if page_num < 1 or page_num > len(pdf):
-            pdf.close()
             raise ValueError(f"Page {page_num} out of range")
 
         page = pdf[page_num - 1]
         width = int(page.get_width() * self.render_scale)
         height = int(page.get_height() * self.render_scale)
-        pdf.close()
         return width, height
 
@@ -1,17 +1,22 @@
 """PDF page separation module."""
 
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Union
 
 import pypdfium2 as pdfium
 from PIL import Image
 
-from fileskadis.core.utils import get_logger, validate_pdf
+from fileskadis.core.utils import get_logger, open_pdf_cached, render_image, validate_pdf
 
 log = get_logger(__name__)
 
 
+_RANGE_RE = re.compile(r"(\d+)\s*-\s*(\d+)")
+
+
 def parse_page_range(range_str: str, max_pages: int) -> list[int]:
     """
     Parse a page range string into list of 0-indexed page numbers.
@@ -23,26 +28,33 @@ def parse_page_range(range_str: str, max_pages: int) -> list[int]:
     Returns:
         List of 0-indexed page numbers
     """
-    pages = set()
-    parts = [p.strip() for p in range_str.split(",") if p.strip()]
-
-    for part in parts:
-        if "-" in part:
-            match = re.match(r"(\d+)\s*-\s*(\d+)", part)
-            if match:
-                start, end = int(match.group(1)), int(match.group(2))
-                for i in range(start, end + 1):
-                    if 1 <= i <= max_pages:
-                        pages.add(i - 1)
-        else:
-            try:
-                page = int(part)
-                if 1 <= page <= max_pages:
-                    pages.add(page - 1)
-            except ValueError:
+    selected = bytearray(max(max_pages, 0))
+
+    for part in range_str.split(","):
+        start, sep, end = part.partition("-")
+        try:
+            first = int(start)
+            last = int(end) if sep else first
+        except ValueError:
+            match = _RANGE_RE.match(part.strip())
+            if not match:
                 continue
+            first, last = int(match.group(1)), int(match.group(2))
+
+        first, last = max(first, 1), min(last, max_pages)
+        if first <= last:
+            selected[first - 1 : last] = b"\x01" * (last - first + 1)
+
+    return [i for i, flag in enumerate(selected) if flag]
 
-    return sorted(pages)
+
+def _render_page_to_png(pdf_path: Path, page_idx: int, out_path: Path, dpi: int) -> Path:
+    """Render one page to a PNG file. Runs in a worker process."""
+    pdf = pdfium.PdfDocument(pdf_path)
+    img = render_image(pdf[page_idx], dpi / 72)
+    img.save(out_path, "PNG", optimize=False, compress_level=1)
+    pdf.close()
+    return out_path
 
 
 class Separator:
@@ -87,25 +99,36 @@ class Separator:
         outputs = []
         stem = pdf_path.stem
 
-        for page_idx in pages:
-            page_num = page_idx + 1
-
-            if as_images:
-                output_file = output_dir / f"{stem}_page{page_num}.png"
-                bitmap = pdf[page_idx].render(scale=self.output_dpi / 72)
-                img = bitmap.to_pil()
-                img.save(output_file, "PNG")
-            else:
+        if as_images:
+            pdf.close()
+            targets = [output_dir / f"{stem}_page{page_idx + 1}.png" for page_idx in pages]
+
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                outputs = list(
+                    executor.map(
+                        _render_page_to_png,
+                        [pdf_path] * len(pages),
+                        pages,
+                        targets,
+                        [self.output_dpi] * len(pages),
+                    )
+                )
+
+            log.debug("pages_rendered", count=len(outputs))
+        else:
+            for page_idx in pages:
+                page_num = page_idx + 1
                 output_file = output_dir / f"{stem}_page{page_num}.pdf"
                 new_pdf = pdfium.PdfDocument.new()
                 new_pdf.import_pages(pdf, [page_idx])
                 new_pdf.save(output_file)
                 new_pdf.close()
 
-            outputs.append(output_file)
-            log.debug("page_extracted", page=page_num, output=output_file.name)
+                outputs.append(output_file)
+                log.debug("page_extracted", page=page_num, output=output_file.name)
+
+            pdf.close()
 
-        pdf.close()
         log.info("extraction_complete", count=len(outputs))
         return outputs
 
@@ -152,10 +175,7 @@ class Separator:
     def get_page_count(self, pdf_path: Union[str, Path]) -> int:
         """Get number of pages in a PDF."""
         pdf_path = validate_pdf(pdf_path)
-        pdf = pdfium.PdfDocument(pdf_path)
-        count = len(pdf)
-        pdf.close()
-        return count
+        return len(open_pdf_cached(pdf_path))
 
     def render_page(
         self,
@@ -175,14 +195,10 @@ class Separator:
             PIL Image of the page
         """
         pdf_path = validate_pdf(pdf_path)
-        pdf = pdfium.PdfDocument(pdf_path)
+        pdf = open_pdf_cached(pdf_path)
 
         if page_num < 1 or page_num > len(pdf):
-            pdf.close()
             raise ValueError(f"Page {page_num} out of range (1-{len(pdf)})")
 
-        bitmap = pdf[page_num - 1].render(scale=scale)
-        img = bitmap.to_pil()
-        pdf.close()
-        return img
+        return render_image(pdf[page_num - 1], scale)
 
@@ -1,14 +1,27 @@
 """Shared utilities for fileskadis."""
 
+import functools
+import threading
 from pathlib import Path
 from typing import Union
 
+import numpy as np
+import PIL
+import pypdfium2 as pdfium
 import structlog
+from PIL import Image
 
 SUPPORTED_IMAGE_FORMATS = {".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".tif", ".gif", ".webp"}
 SUPPORTED_PDF_FORMATS = {".pdf"}
 SUPPORTED_FORMATS = SUPPORTED_IMAGE_FORMATS | SUPPORTED_PDF_FORMATS
 
+# Pillow-SIMD is a drop-in fork of Pillow published with ".postN" versions.
+PILLOW_SIMD = ".post" in PIL.__version__
+
+# PDFium is not thread-safe, not even across separate documents, so every
+# pdfium call made from a worker thread must hold this lock.
+PDFIUM_LOCK = threading.Lock()
+
 
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     """Get a configured structlog logger."""
@@ -30,6 +43,35 @@ def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     return structlog.get_logger(name)
 
 
+@functools.lru_cache(maxsize=8)
+def _open_pdf_cached(path_str: str, mtime_ns: int) -> pdfium.PdfDocument:
+    return pdfium.PdfDocument(path_str)
+
+
+def open_pdf_cached(path: Path) -> pdfium.PdfDocument:
+    """
+    Open a PDF through a small LRU cache keyed by path and modification time.
+
+    The returned document is shared between callers and must not be closed;
+    pypdfium2 closes it once it is evicted and no longer referenced.
+    """
+    return _open_pdf_cached(str(path), path.stat().st_mtime_ns)
+
+
+def render_array(page: pdfium.PdfPage, scale: float) -> np.ndarray:
+    """Render a page to an RGB(A) numpy array backed by the bitmap buffer."""
+    bitmap = page.render(scale=scale, rev_byteorder=True)
+    arr = bitmap.to_numpy()
+    if not arr.flags.c_contiguous:
+        arr = np.ascontiguousarray(arr)
+    return arr
+
+
+def render_image(page: pdfium.PdfPage, scale: float) -> Image.Image:
+    """Render a page to a PIL image without the intermediate bitmap.to_pil() copy."""
+    return Image.fromarray(render_array(page, scale))
+
+
 def validate_file(path: Union[str, Path]) -> Path:
     """Validate a single file path and return Path object."""
     p = Path(path)
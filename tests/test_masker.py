@@ -1,11 +1,30 @@
 """Tests for the masker module."""
 
+import tempfile
+from pathlib import Path
+
+import pypdfium2 as pdfium
 import pytest
 from PIL import Image
 
 from fileskadis.core.masker import Masker, Region
 
 
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as d:
+        yield Path(d)
+
+
+@pytest.fixture
+def sample_pdf(temp_dir):
+    """Create a three-page test PDF."""
+    path = temp_dir / "sample.pdf"
+    pages = [Image.new("RGB", (200, 300), color) for color in ["red", "green", "blue"]]
+    pages[0].save(path, "PDF", save_all=True, append_images=pages[1:], resolution=72)
+    return path
+
+
 class TestRegion:
     def test_box_property(self):
         r = Region(x=10, y=20, width=100, height=50)
@@ -57,3 +76,38 @@ class TestMasker:
         center_pixel = result.getpixel((100, 100))
         assert center_pixel == (255, 255, 255)
 
+    def test_apply_masks_blur_only_touches_region(self):
+        m = Masker(blur_radius=5)
+        img = Image.new("RGB", (200, 200), "white")
+        img.paste((0, 0, 0), (0, 0, 100, 200))
+        regions = [Region(x=80, y=50, width=40, height=100)]
+
+        result = m._apply_masks(img, regions, "blur")
+
+        assert result.getpixel((100, 100)) != img.getpixel((100, 100))
+        assert result.getpixel((130, 100)) == (255, 255, 255)
+        assert result.getpixel((70, 100)) == (0, 0, 0)
+
+    def test_apply_masks_clips_out_of_bounds(self):
+        m = Masker()
+        img = Image.new("RGB", (200, 200), "white")
+        regions = [
+            Region(x=150, y=150, width=100, height=100),
+            Region(x=300, y=300, width=10, height=10),
+        ]
+
+        result = m._apply_masks(img, regions, "black")
+
+        assert result.getpixel((199, 199)) == (0, 0, 0)
+        assert result.getpixel((149, 149)) == (255, 255, 255)
+
+    def test_redact_keeps_page_count(self, sample_pdf, temp_dir):
+        m = Masker(render_scale=1.0)
+        output = temp_dir / "redacted.pdf"
+        regions = {2: [Region(x=10, y=10, width=50, height=50)]}
+
+        result = m.redact(sample_pdf, regions, output, mask_type="black")
+
+        pdf = pdfium.PdfDocument(result)
+        assert len(pdf) == 3
+        pdf.close()
@@ -1,8 +1,28 @@
 """Tests for the separator module."""
 
+import os
+import tempfile
+from pathlib import Path
+
 import pytest
+from PIL import Image
+
+from fileskadis.core.separator import Separator, parse_page_range
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as d:
+        yield Path(d)
+
 
-from fileskadis.core.separator import parse_page_range
+@pytest.fixture
+def sample_pdf(temp_dir):
+    """Create a five-page test PDF."""
+    path = temp_dir / "sample.pdf"
+    pages = [Image.new("RGB", (100, 150), "white") for _ in range(5)]
+    pages[0].save(path, "PDF", save_all=True, append_images=pages[1:], resolution=72)
+    return path
 
 
 class TestParsePageRange:
@@ -31,3 +51,52 @@ class TestParsePageRange:
         result = parse_page_range("1, 1, 1-2", 10)
         assert result == [0, 1]
 
+    def test_huge_range_clamped(self):
+        assert parse_page_range("3-1000000000", 5) == [2, 3, 4]
+
+    def test_reversed_range_ignored(self):
+        assert parse_page_range("5-2, 1", 10) == [0]
+
+
+class TestSeparator:
+    def test_extract_pdf_pages(self, sample_pdf, temp_dir):
+        sep = Separator()
+        outputs = sep.extract(sample_pdf, "1-2, 4", temp_dir / "out")
+
+        assert [p.name for p in outputs] == [
+            "sample_page1.pdf",
+            "sample_page2.pdf",
+            "sample_page4.pdf",
+        ]
+        assert all(p.exists() for p in outputs)
+
+    def test_extract_as_images(self, sample_pdf, temp_dir):
+        sep = Separator(output_dpi=72)
+        outputs = sep.extract(sample_pdf, "2-3", temp_dir / "out", as_images=True)
+
+        assert [p.name for p in outputs] == ["sample_page2.png", "sample_page3.png"]
+        with Image.open(outputs[0]) as img:
+            assert img.size == (100, 150)
+
+    def test_get_page_count_tracks_file_changes(self, sample_pdf):
+        sep = Separator()
+        assert sep.get_page_count(sample_pdf) == 5
+
+        Image.new("RGB", (100, 150), "white").save(sample_pdf, "PDF")
+        stat = sample_pdf.stat()
+        os.utime(sample_pdf, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert sep.get_page_count(sample_pdf) == 1
+
+    def test_render_page(self, sample_pdf):
+        sep = Separator()
+        img = sep.render_page(sample_pdf, 2, scale=1.0)
+
+        assert img.size == (100, 150)
+        with pytest.raises(ValueError):
+            sep.render_page(sample_pdf, 6)
+
+    def test_extract_invalid_range_raises(self, sample_pdf, temp_dir):
+        sep = Separator()
+        with pytest.raises(ValueError):
+            sep.extract(sample_pdf, "10-12", temp_dir / "out")